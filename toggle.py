@@ -1,9 +1,10 @@
 import sys
+import functools
 from PyQt6.QtWidgets import (
     QApplication, QComboBox, QGraphicsDropShadowEffect, QGridLayout, QMainWindow, QSlider, QVBoxLayout, QHBoxLayout, QPushButton, QWidget, QStackedWidget, QLabel
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QColor
+from PyQt6.QtCore import Qt, QPoint, QSize, QStringListModel, QTimer
+from PyQt6.QtGui import QIcon, QColor, QFont, QFontMetrics
 from matplotlib.backends.backend_qtagg import FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
@@ -58,25 +59,86 @@ def add_size_legend(ax, size_data, size_attr, scale_factor):
             weight='bold'
         )
 
-        for i, (val, marker) in enumerate(zip(size_values, size_markers)):
-            ax.scatter(
-                [i * 1.2], [0],
-                s=marker,
-                color='gray',
-                alpha=0.6,
-                edgecolors='black',
-            )
+        ax.scatter(
+            np.arange(len(size_values)) * 1.2, np.zeros(len(size_values)),
+            s=size_markers,
+            color='gray',
+            alpha=0.6,
+            edgecolors='black',
+        )
 
         ax.set_xlim(-2, legend_width + 1)
         ax.set_ylim(-0.5, 1)
         ax.axis('off')
 
-def add_dynamic_size_legend(ax, size_data, size_attr, scale_factor):
+def format_tooltip_html(data_row):
+        return (
+            f"<b>{data_row['Country name']}</b><br>"
+            f"Ladder Score: {data_row['Ladder score']:.2f}<br>"
+            f"Standard Error: {data_row['Standard error of ladder score']:.2f}<br>"
+            f"Upperwhisker: {data_row['upperwhisker']:.2f}<br>"
+            f"Lowerwhisker: {data_row['lowerwhisker']:.2f}<br>"
+            f"Logged GDP per Capita: {data_row['Logged GDP per capita']:.2f}<br>"
+            f"Social Support: {data_row['Social support']:.2f}<br>"
+            f"Healthy Life Expectancy: {data_row['Healthy life expectancy']:.2f}<br>"
+            f"Freedom to Make Life Choices: {data_row['Freedom to make life choices']:.2f}<br>"
+            f"Generosity: {data_row['Generosity']:.2f}<br>"
+            f"Perceptions of Corruption: {data_row['Perceptions of corruption']:.2f}<br>"
+            f"Explained by Log GDP per Capita: {data_row['Explained by: Log GDP per capita']:.2f}<br>"
+            f"Explained by Social Support: {data_row['Explained by: Social support']:.2f}<br>"
+            f"Explained by Healthy Life Expectancy: {data_row['Explained by: Healthy life expectancy']:.2f}<br>"
+            f"Explained by Freedom to Make Life Choices: {data_row['Explained by: Freedom to make life choices']:.2f}"
+        )
+
+def canvas_pos(canvas, event):
+        # Widget position of a Matplotlib mouse event; works after guiEvent has been released
+        dpr = canvas.device_pixel_ratio
+        return QPoint(round(event.x / dpr), round((canvas.figure.bbox.height - event.y) / dpr))
+
+def place_tooltip(tooltip, mouse_pos, window_width, window_height):
+        # Below-right of the cursor, flipped to the other side where it would leave the window
+        tooltip_width = tooltip.width()
+        tooltip_height = tooltip.height()
+        offset_x = 20
+        offset_y = 20
+
+        if mouse_pos.x() + offset_x + tooltip_width > window_width:
+            offset_x = -tooltip_width - 20
+        if mouse_pos.y() + offset_y + tooltip_height > window_height:
+            offset_y = -tooltip_height - 20
+
+        if mouse_pos.x() + offset_x < 0:
+            offset_x = 20
+        if mouse_pos.y() + offset_y < 0:
+            offset_y = 20
+
+        tooltip.move(mouse_pos.x() + offset_x + 5, mouse_pos.y() + offset_y + 5)
+
+def label_point(geometry):
+        if geometry.geom_type == "Polygon":
+            return geometry.representative_point()
+        if geometry.geom_type == "MultiPolygon":
+            largest_polygon = max(geometry.geoms, key=lambda p: p.area)
+            return largest_polygon.representative_point()
+        return None
+
+def exterior_coords(geometry):
+        if geometry.geom_type == "Polygon":
+            return [np.asarray(geometry.exterior.coords)]
+        if geometry.geom_type == "MultiPolygon":
+            return [np.asarray(poly.exterior.coords) for poly in geometry.geoms]
+        return []
+
+def dynamic_size_legend_values(size_data, scale_factor):
         size_min, size_max = size_data.min(), size_data.max()
         size_values = np.linspace(size_min, size_max, num=3)
         
         size_markers = 50 + ((size_values - size_min) / (size_max - size_min)) * 950
         size_markers *= scale_factor / 50
+        return size_values, size_markers
+
+def add_dynamic_size_legend(ax, size_data, size_attr, scale_factor):
+        size_values, size_markers = dynamic_size_legend_values(size_data, scale_factor)
 
         legend_elements = [
             plt.Line2D(
@@ -102,47 +164,107 @@ def add_dynamic_size_legend(ax, size_data, size_attr, scale_factor):
             borderpad=0.7,
         )
 
+''' -------- Data Loading -------- '''
+MANUAL_COUNTRY_CODES = {
+    "Taiwan Province of China": "TWN",
+    "Kosovo": "XKX",
+    "South Korea": "KOR",
+    "Moldova": "MDA",
+    "Vietnam": "VNM",
+    "Bolivia": "BOL",
+    "Russia": "RUS",
+    "Hong Kong S.A.R. of China": "HKG",
+    "Congo (Brazzaville)": "COG",
+    "Congo (Kinshasa)": "COD",
+    "Venezuela": "VEN",
+    "Laos": "LAO",
+    "Ivory Coast": "CIV",
+    "State of Palestine": "PSE",
+    "Iran": "IRN",
+    "Turkiye": "TUR",
+    "Tanzania": "TZA",
+}
+
+# Loaders are cached so every view shares one parse; callers copy before mutating
+@functools.lru_cache(maxsize=1)
+def _load_whr():
+    return pd.read_csv("WHR2023.csv")
+
+@functools.lru_cache(maxsize=1)
+def _load_worldmap():
+    return gpd.read_file("world_map.json", driver='GeoJSON')
+
+@functools.lru_cache(maxsize=1)
+def _country_code_map():
+    # The manual names never collide with pycountry's, so one merged dict needs a single lookup pass
+    return {
+        **{country.name: country.alpha_3 for country in pycountry.countries},
+        **MANUAL_COUNTRY_CODES,
+    }
+
+@functools.lru_cache(maxsize=1)
+def _load_whr_with_codes():
+    data = _load_whr().copy()
+    data['Country code'] = data['Country name'].map(_country_code_map())
+    return data
+
+''' -------- Hover Handling -------- '''
+class HoverMixin:
+    def setup_hover(self):
+        # Handle only the latest motion event, at most once per frame
+        self.pending_hover_event = None
+        self.hover_timer = QTimer(self)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(16)
+        self.hover_timer.timeout.connect(self.process_hover)
+
+        # Hover reads these instead of walking the widget tree; refreshed in resizeEvent
+        self.window_size = (self.width(), self.height())
+        self.canvas_offsets = {}
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.window_size = (self.width(), self.height())
+        self.canvas_offsets = {}
+
+    def local_pos(self, canvas, event):
+        # Canvas origin is looked up once per resize, after the layout has placed the canvas
+        if canvas not in self.canvas_offsets:
+            self.canvas_offsets[canvas] = canvas.mapTo(self, QPoint(0, 0))
+        return canvas_pos(canvas, event) + self.canvas_offsets[canvas]
+
+    def queue_hover(self, event):
+        self.pending_hover_event = event
+        if not self.hover_timer.isActive():
+            self.hover_timer.start()
+
+    def process_hover(self):
+        event, self.pending_hover_event = self.pending_hover_event, None
+        if event is not None:
+            self.on_hover(event)
+
 ''' -------- Bubble Chart App -------- '''
 class BubbleChart(QWidget):
     def __init__(self):
         super().__init__()
 
-        self.worldmap = gpd.read_file("world_map.json", driver='GeoJSON')
+        self.worldmap = _load_worldmap()
 
-        self.data = pd.read_csv("WHR2023.csv")   
+        self.data = _load_whr_with_codes()
         excluded_column = 'Ladder score in Dystopia'
         self.data = self.data.loc[:, self.data.columns != excluded_column]
-        country_to_code = {country.name: country.alpha_3 for country in pycountry.countries}
-        
-        self.data['Country code'] = self.data['Country name'].map(country_to_code)
-
-        manual_mapping = {
-            "Taiwan Province of China": "TWN",
-            "Kosovo": "XKX",
-            "South Korea": "KOR",
-            "Moldova": "MDA",
-            "Vietnam": "VNM",
-            "Bolivia": "BOL",
-            "Russia": "RUS",
-            "Hong Kong S.A.R. of China": "HKG",
-            "Congo (Brazzaville)": "COG",
-            "Congo (Kinshasa)": "COD",
-            "Venezuela": "VEN",
-            "Laos": "LAO",
-            "Ivory Coast": "CIV",
-            "State of Palestine": "PSE",
-            "Iran": "IRN",
-            "Turkiye": "TUR",
-            "Tanzania": "TZA",
-        }
-        self.data['Country code'] = self.data['Country code'].fillna(self.data['Country name'].map(manual_mapping))
 
         # Map population estimates from worldmap to data
-        self.worldmap['pop_est'] = self.worldmap['pop_est'].fillna(0)
-        pop_est_mapping = dict(zip(self.worldmap['adm0_a3'], self.worldmap['pop_est']))
-        self.data['pop_est'] = self.data['Country code'].map(pop_est_mapping)
+        population = self.worldmap[['adm0_a3', 'pop_est']].rename(columns={'adm0_a3': 'Country code'})
+        population['pop_est'] = population['pop_est'].fillna(0)
+        self.data = self.data.merge(population, how='left', on='Country code')
         self.data = self.data.dropna(subset=["Logged GDP per capita", "Ladder score", "pop_est"])
 
+        # Plain arrays for the hover/update paths instead of pandas indexing
+        numeric_columns = self.data.select_dtypes(include='number').columns
+        self._num = {column: self.data[column].to_numpy(dtype=np.float64) for column in numeric_columns}
+        self._names = self.data['Country name'].to_numpy()
+
         layout = QVBoxLayout(self)
 
         self.attributes = {
@@ -171,17 +293,80 @@ class BubbleChart(QWidget):
         layout.addLayout(button_layout)
 
         self.update_button_styles(self.buttons[0])
-        self.selected_indices = set()
-        self.edgecolors = ["white"] * len(self.data)
-        self.linewidths = [0.5] * len(self.data)
+        # RGBA edge colours and widths kept as arrays so Matplotlib never re-parses colour names
+        self.white_edge = np.array([1.0, 1.0, 1.0, 1.0])
+        self.red_edge = np.array([1.0, 0.0, 0.0, 1.0])
+        self.selected_mask = np.zeros(len(self.data), dtype=bool)
+        self.edgecolors = np.tile(self.white_edge, (len(self.data), 1))
+        self.linewidths = np.full(len(self.data), 0.5)
 
         self.cbar = None
         self.left_label = None
         self.right_label = None
 
+        self.ax.set_position([0.1, 0.25, 0.8, 0.6])
+        self.ax.axis('off')
+        self.scatter = self.ax.scatter(
+            [], [],
+            c=[],
+            cmap="viridis",
+            alpha=0.6,
+            edgecolors=self.edgecolors,
+            linewidths=self.linewidths
+        )
+        self.left_axis_label = self.ax.text(
+            0, 0, "",
+            fontsize=10,
+            ha='center',
+            va='center',
+            color="black",
+            weight="heavy"
+        )
+        self.right_axis_label = self.ax.text(
+            0, 0, "",
+            fontsize=10,
+            ha='center',
+            va='center',
+            color="black",
+            weight="heavy"
+        )
+        self.hover_marker = self.ax.scatter(
+            [], [],
+            facecolors='none',
+            edgecolors='black',
+            linewidths=2,
+            alpha=0.6,
+            animated=True
+        )
+        self.background = None
+        self.hit_points = None
+        self.hit_radii = None
+
+        self.size_legend_ax = self.figure.add_axes([0.05, 0.08, 0.4, 0.15])
+        add_size_legend(self.size_legend_ax, self.data["pop_est"], "Population Size", scale_factor=100)
+
         self.tooltip = QLabel(self)
-        self.tooltip.setStyleSheet("background-color: white; border-radius: 15px; padding: 5px;")
-        self.tooltip.setFixedSize(225, 63)
+        self.tooltip.setStyleSheet("""
+            background-color: white;
+            border-radius: 15px;
+            padding: 10px;
+            color: black;
+            font-size: 16px;
+        """)
+        self.tooltip_template = """
+            <div style="line-height: 1.15;">
+                <b>{name}</b><br>
+                Happiness Score: {score:.2f}
+            </div>
+            """
+        # Size the tooltip once for the widest country name so hovering never relayouts it
+        self.tooltip.ensurePolished()
+        bold_font = QFont(self.tooltip.font())
+        bold_font.setBold(True)
+        widest_name = max(self._names, key=QFontMetrics(bold_font).horizontalAdvance)
+        self.tooltip.setText(self.tooltip_template.format(name=widest_name, score=self._num["Ladder score"].max()))
+        self.tooltip.adjustSize()
+        self.tooltip.setFixedSize(self.tooltip.size())
         self.tooltip.move(50, 50)
         shadow = QGraphicsDropShadowEffect(self.tooltip)
         shadow.setBlurRadius(15)
@@ -192,10 +377,9 @@ class BubbleChart(QWidget):
 
         self.canvas.mpl_connect('motion_notify_event', self.on_hover)
         self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         self.update_data("Logged GDP per capita")
-        self.ax.set_position([0.1, 0.25, 0.8, 0.6])
-        self.canvas.draw()
         self.position_colorbar_labels()
     
     def on_button_click(self, attribute, button):
@@ -203,169 +387,122 @@ class BubbleChart(QWidget):
         self.update_button_styles(button)
     
     def update_data(self, x_attribute):
-        self.ax.clear()
-        x = self.data[x_attribute]
-        y = self.data["Ladder score"]
-        color = self.data["Ladder score"]
+        x = self._num[x_attribute]
+        y = self._num["Ladder score"]
+        color = self._num["Ladder score"]
 
-        size = self.data["pop_est"]
-        size = size.clip(lower=0)
+        size = self._num["pop_est"]
+        size = size.clip(min=0)
         size_scaled = 50 + ((size - size.min()) / (size.max() - size.min())) * 950
         size_scaled *= 100 / 50
 
-        self.ax.set_position([0.1, 0.25, 0.8, 0.6])
-
-        self.scatter = self.ax.scatter(
-            x, y,
-            s=size_scaled,
-            c=color,
-            cmap="viridis",
-            alpha=0.6,
-            edgecolors=self.edgecolors,
-            linewidths=self.linewidths
-        )
-
+        # Reuse the same PathCollection and only swap its arrays
+        offsets = np.column_stack((x, y))
+        self.scatter.set_offsets(offsets)
+        self.scatter.set_sizes(size_scaled)
+        self.scatter.set_array(color)
+        self.scatter.set_clim(color.min(), color.max())
+        # Display positions for hit_test are stale now; don't wait for the idle draw to reset them
+        self.hit_points = None
+
+        self.ax.relim()
+        self.ax.update_datalim(offsets)
+        self.ax.autoscale_view()
         self.ax.set_ylim([y.min() - 5, y.max() + 5])
-        self.ax.axis('off')
 
         left_label, right_label = self.attributes[x_attribute]
-        self.ax.text(
-            x.min() - (x.max() - x.min()) * 0.1,
-            y.mean(),
-            left_label, 
-            fontsize=10, 
-            ha='center', 
-            va='center', 
-            color="black",
-            weight="heavy"
-        )
-        self.ax.text(
-            x.max() + (x.max() - x.min()) * 0.1,
-            y.mean(),
-            right_label, 
-            fontsize=10, 
-            ha='center', 
-            va='center', 
-            color="black",
-            weight="heavy"
-        )
+        x_min, x_max = np.nanmin(x), np.nanmax(x)
+        self.left_axis_label.set_position((x_min - (x_max - x_min) * 0.1, y.mean()))
+        self.left_axis_label.set_text(left_label)
+        self.right_axis_label.set_position((x_max + (x_max - x_min) * 0.1, y.mean()))
+        self.right_axis_label.set_text(right_label)
         self.ax.set_title(f"{x_attribute}", fontsize=18, weight='bold', pad=20)
 
         if self.cbar is None:
             self.cbar = self.figure.colorbar(self.scatter, ax=self.ax, orientation="horizontal", fraction=0.03)
-        else:
-            self.cbar.update_normal(self.scatter)
-
-        self.cbar.ax.set_position([0.55, 0.12, 0.4, 0.02])
-        self.cbar.set_ticks([])
-
-        if hasattr(self, "size_legend_ax"):
-            self.size_legend_ax.remove()
-        self.size_legend_ax = self.figure.add_axes([0.05, 0.08, 0.4, 0.15])
-        add_size_legend(self.size_legend_ax, self.data["pop_est"], "Population Size", scale_factor=100)
+            self.cbar.ax.set_position([0.55, 0.12, 0.4, 0.02])
+            self.cbar.set_ticks([])
+            self.ax.set_position([0.1, 0.25, 0.8, 0.6])
 
         self.position_colorbar_labels()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def on_draw(self, event):
+        # Cache everything except the hover marker so hovering only needs a blit
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.ax.draw_artist(self.hover_marker)
+        # Limits, data or canvas size may have changed, so display positions are stale
+        self.hit_points = None
+
+    def hit_test(self, event):
+        if self.hit_points is None:
+            self.hit_points = self.ax.transData.transform(self.scatter.get_offsets())
+            self.hit_radii = np.sqrt(self.scatter.get_sizes()) / 2 * self.figure.dpi / 72
+
+        distances = np.hypot(self.hit_points[:, 0] - event.x, self.hit_points[:, 1] - event.y)
+        # Countries missing the current attribute have NaN positions and are never hit
+        nearest = int(np.nanargmin(distances))
+        if distances[nearest] <= self.hit_radii[nearest]:
+            return nearest
+        return None
+
+    def blit_hover(self):
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.hover_marker)
+        self.canvas.blit(self.figure.bbox)
 
     def on_hover(self, event):
         if event.inaxes != self.ax:
             self.tooltip.hide()
+            if self.hover_marker.get_visible():
+                self.hover_marker.set_visible(False)
+                self.blit_hover()
             return
         
-        cont, ind = self.scatter.contains(event)
-        if cont:
-            hovered_index = ind["ind"][0]
-
-            country_name = self.data.iloc[hovered_index]["Country name"]
-            ladder_score = self.data.iloc[hovered_index]["Ladder score"]
-
-            details = f"""
-            <div style="line-height: 1.15;">
-                <b>{country_name}</b><br>
-                Happiness Score: {ladder_score:.2f}
-            </div>
-            """
-            self.tooltip.setStyleSheet("""
-                background-color: white;
-                border-radius: 15px;
-                padding: 10px;
-                color: black;
-                font-size: 16px;
-            """)
-            self.tooltip.setText(details)
-            self.tooltip.adjustSize()
+        hovered_index = self.hit_test(event)
+        if hovered_index is not None:
+            self.tooltip.setText(self.tooltip_template.format(
+                name=self._names[hovered_index],
+                score=self._num["Ladder score"][hovered_index]
+            ))
             self.tooltip.show()
 
-            global_pos = self.canvas.mapToGlobal(event.guiEvent.pos())
-            local_pos = self.mapFromGlobal(global_pos)
-
-            mouse_x = local_pos.x()
-            mouse_y = local_pos.y()
-            tooltip_width = self.tooltip.width()
-            tooltip_height = self.tooltip.height()
-
-            offset_x = 20
-            offset_y = 20
-
-            window_geometry = self.geometry()
-            window_width, window_height = (
-                window_geometry.width(),
-                window_geometry.height(),
-            )
-
-            if mouse_x + offset_x + tooltip_width > window_width:
-                offset_x = -tooltip_width - 20
-            if mouse_y + offset_y + tooltip_height > window_height:
-                offset_y = -tooltip_height - 20
-
-            if mouse_x + offset_x < 0:
-                offset_x = 20
-            if mouse_y + offset_y < 0:
-                offset_y = 20
-
-            new_x = mouse_x + offset_x
-            new_y = mouse_y + offset_y
-
-            self.tooltip.move(new_x + 5, new_y + 5)
-
-            hover_edgecolors = self.edgecolors[:]
-            hover_linewidths = self.linewidths[:]
-
-            if hover_edgecolors[hovered_index] != "red":
-                hover_edgecolors[hovered_index] = "black"
-                hover_linewidths[hovered_index] = 2
+            local_pos = self.mapFromGlobal(self.canvas.mapToGlobal(event.guiEvent.pos()))
+            place_tooltip(self.tooltip, local_pos, self.width(), self.height())
 
-            self.scatter.set_edgecolors(hover_edgecolors)
-            self.scatter.set_linewidths(hover_linewidths)
-            self.canvas.draw()
+            if not self.selected_mask[hovered_index]:
+                self.hover_marker.set_offsets(self.scatter.get_offsets()[hovered_index:hovered_index + 1])
+                self.hover_marker.set_sizes(self.scatter.get_sizes()[hovered_index:hovered_index + 1])
+                self.hover_marker.set_visible(True)
+            else:
+                self.hover_marker.set_visible(False)
+            self.blit_hover()
         else:
             self.tooltip.hide()
-            self.scatter.set_edgecolors(self.edgecolors)
-            self.scatter.set_linewidths(self.linewidths)
-            self.canvas.draw()
+            self.hover_marker.set_visible(False)
+            self.blit_hover()
 
     def on_click(self, event):
         if event.inaxes != self.ax:
             return
         
-        cont, ind = self.scatter.contains(event)
+        clicked_index = self.hit_test(event)
 
-        if cont:
-            clicked_index = ind["ind"][0]
-
-            if self.edgecolors[clicked_index] == "red":
-                self.edgecolors[clicked_index] = "white"
-                self.linewidths[clicked_index] = 0.5
-                self.selected_indices.remove(clicked_index)
-            else:
-                self.edgecolors[clicked_index] = "red"
-                self.linewidths[clicked_index] = 2
-                self.selected_indices.add(clicked_index)
+        if clicked_index is not None:
+            selected = not self.selected_mask[clicked_index]
+            self.selected_mask[clicked_index] = selected
+            self.edgecolors[clicked_index] = self.red_edge if selected else self.white_edge
+            self.linewidths[clicked_index] = 2 if selected else 0.5
 
+            self.hover_marker.set_visible(not selected)
             self.scatter.set_edgecolors(self.edgecolors)
             self.scatter.set_linewidths(self.linewidths)
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
     def position_colorbar_labels(self):
         if self.cbar is None:
@@ -420,7 +557,7 @@ class BubbleChart(QWidget):
                 weight='bold'
             )
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def update_button_styles(self, selected_button):
         default_style = (
@@ -454,51 +591,83 @@ class Brush:
         self.data = df
         self.ax = ax
         self.canvas = canvas
-        self.selected = []
-        self.default_colors = list(default_colors)
-        self.colors = list(default_colors)
+        self.selected = np.empty(0, dtype=np.intp)
+        self.default_colors = np.asarray(default_colors)
+        self.colors = self.default_colors
         self.sizes = size_scaled
         self.scatter_plot = None
+        self.brushed = False
+        self._gray_row = np.array(gray)
+        self._columns = {}
+        self._mask = np.zeros(len(df), dtype=bool)
+        self._scratch = np.zeros(len(df), dtype=bool)
+
+    def set_defaults(self, default_colors, sizes):
+        self.selected = np.empty(0, dtype=np.intp)
+        self.default_colors = np.asarray(default_colors)
+        self.colors = self.default_colors
+        self.sizes = np.asarray(sizes)
+        self.brushed = False
+
+    def reset_colors(self):
+        self.selected = np.empty(0, dtype=np.intp)
+        if self.brushed or self.colors is not self.default_colors:
+            self.colors = self.default_colors
+            if self.brushed:
+                self.scatter_plot.set_antialiased(True)
+                self.brushed = False
+            self.draw_colors()
+
+    def drop_column(self, attr):
+        self._columns.pop(attr, None)
+
+    def column(self, attr):
+        if attr not in self._columns:
+            self._columns[attr] = pd.to_numeric(self.data[attr], errors='coerce').to_numpy(dtype=np.float64)
+        return self._columns[attr]
     
     def update_colors(self, selected):
         if len(selected) == 0:
-            self.colors = list(self.default_colors)
+            self.colors = self.default_colors
         else:
-            self.colors = [gray if i not in selected else self.default_colors[i] for i in range(len(self.data))]
+            mask = np.zeros(len(self.data), dtype=bool)
+            mask[np.asarray(selected, dtype=np.intp)] = True
+            self.colors = np.where(mask[:, None], self.default_colors, self._gray_row)
 
-    def callback(self, eclick, erelease, x_attr, y_attr):
-        if self.scatter_plot is not None and self.scatter_plot in self.ax.collections:
-            self.scatter_plot.remove()
-            self.scatter_plot = None
+    def draw_colors(self):
+        # Drop the colour-mapped array so the explicit facecolors are not overridden at draw time
+        self.scatter_plot.set_array(None)
+        self.scatter_plot.set_facecolors(self.colors)
+        self.canvas.draw_idle()
 
-        self.data = self.data.dropna(subset=[x_attr, y_attr]).reset_index(drop=True)
-        self.data[x_attr] = pd.to_numeric(self.data[x_attr], errors='coerce')
-        self.data[y_attr] = pd.to_numeric(self.data[y_attr], errors='coerce')
+    def callback(self, eclick, erelease, x_attr, y_attr):
+        xs = self.column(x_attr)
+        ys = self.column(y_attr)
 
         x1, x2 = sorted([eclick.xdata, erelease.xdata])
         y1, y2 = sorted([eclick.ydata, erelease.ydata])
 
-        self.selected = self.data[(self.data[x_attr].between(x1, x2, inclusive='both')) &
-                                (self.data[y_attr].between(y1, y2, inclusive='both'))]
-        self.update_colors(list(self.selected.index))
-        self.scatter_plot = self.ax.scatter(
-            self.data[x_attr],
-            self.data[y_attr],
-            c=self.colors,
-            s=self.sizes,
-            alpha=0.6,
-            edgecolors='w',
-            linewidths=0.5,
-            antialiased=False,
-        )
-        self.canvas.draw()
+        # Build the in-rectangle mask in preallocated buffers; NaN coordinates never match
+        np.greater_equal(xs, x1, out=self._mask)
+        np.less_equal(xs, x2, out=self._scratch)
+        self._mask &= self._scratch
+        np.greater_equal(ys, y1, out=self._scratch)
+        self._mask &= self._scratch
+        np.less_equal(ys, y2, out=self._scratch)
+        self._mask &= self._scratch
+
+        self.selected = np.flatnonzero(self._mask)
+        self.update_colors(self.selected)
+        # The brushed graph renders without antialiasing, as its re-drawn scatter always did
+        self.scatter_plot.set_antialiased(False)
+        self.brushed = True
+        self.draw_colors()
 
 ''' -------- Brushing Chart App -------- '''
-class BrushingChart(QWidget):
+class BrushingChart(HoverMixin, QWidget):
     def __init__(self):
         super().__init__()
-        self.data = pd.read_csv("WHR2023.csv")
-        self.data = self.data.dropna()
+        self.data = _load_whr().dropna()
 
         excluded_column = 'Ladder score in Dystopia'
         self.data = self.data.loc[:, self.data.columns != excluded_column]
@@ -506,124 +675,19 @@ class BrushingChart(QWidget):
         main_layout = QGridLayout(self)
 
         self.tooltip_enabled = True
+
         self.legend_enabled_1 = True
         self.legend_enabled_2 = True
+        self.size_legend_1 = None
+        self.size_legend_2 = None
+        self.size_legend_key_1 = None
+        self.size_legend_key_2 = None
 
-        # FIGURE ONE
-        graph1_layout = QVBoxLayout()
-        self.mpl_canvas_1 = FigureCanvas(Figure(figsize=(9, 7)))
-        self.ax_1 = self.mpl_canvas_1.figure.subplots()
-
-        self.x_dropdown_1 = QComboBox(self)
-        self.x_dropdown_1.addItems(self.data.columns)
-        self.x_dropdown_1.setFixedSize(200, 30)
-
-        self.y_dropdown_1 = QComboBox(self)
-        self.y_dropdown_1.addItems(self.data.columns)
-        self.y_dropdown_1.setFixedSize(200, 30)
-
-        self.color_dropdown_1 = QComboBox(self)
-        self.color_dropdown_1.addItems(self.data.columns)
-        self.color_dropdown_1.setFixedSize(200, 30)
-        
-        self.size_dropdown_1 = QComboBox(self)
-        self.size_dropdown_1.addItems(self.data.columns)
-        self.size_dropdown_1.setFixedSize(200, 30)
-
-        self.size_slider_1 = QSlider(Qt.Orientation.Horizontal, self)
-        self.size_slider_1.setRange(1, 100)
-        self.size_slider_1.setValue(50)
-        self.size_slider_1.valueChanged.connect(self.update_data)
-
-        self.toggle_legend_btn_1 = QPushButton("Legend (Graph 1)", self)
-        self.toggle_legend_btn_1.setIcon(QIcon("Icons/ToggleButtonOn.png"))
-        self.toggle_legend_btn_1.setIconSize(QSize(40, 40))
-        self.toggle_legend_btn_1.setFixedSize(150, 25)
-        self.toggle_legend_btn_1.setStyleSheet("""
-            QPushButton {
-                border: none;
-            }
-        """)
-        self.toggle_legend_btn_1.clicked.connect(lambda: self.toggle_legend(1))
-
-        controls_container_1 = QVBoxLayout()
-        controls_layout_1 = QGridLayout()
-
-        controls_layout_1.addWidget(self.toggle_legend_btn_1, 0, 0, 1, 4)
-        controls_layout_1.addWidget(QLabel('X Axis (Graph 1):'), 1, 0)
-        controls_layout_1.addWidget(self.x_dropdown_1, 1, 1)
-        controls_layout_1.addWidget(QLabel('Y Axis (Graph 1):'), 1, 2)
-        controls_layout_1.addWidget(self.y_dropdown_1, 1, 3)
-        controls_layout_1.addWidget(QLabel('Size (Graph 1):'), 2, 0)
-        controls_layout_1.addWidget(self.size_dropdown_1, 2, 1)
-        controls_layout_1.addWidget(QLabel('Color (Graph 1):'), 2, 2)
-        controls_layout_1.addWidget(self.color_dropdown_1, 2, 3)
-        controls_layout_1.addWidget(QLabel('Size Scale (Graph 1):'), 3, 0)
-        controls_layout_1.addWidget(self.size_slider_1, 3, 1, 1, 3)
-
-        controls_container_1.addLayout(controls_layout_1)
-
-        graph1_layout.addWidget(NavigationToolbar(self.mpl_canvas_1, self))
-        graph1_layout.addWidget(self.mpl_canvas_1)
-        graph1_layout.addLayout(controls_container_1)
-
-        # FIGURE TWO
-        graph2_layout = QVBoxLayout()
-        self.mpl_canvas_2 = FigureCanvas(Figure(figsize=(9, 7)))
-        self.ax_2 = self.mpl_canvas_2.figure.subplots()
-
-        self.x_dropdown_2 = QComboBox(self)
-        self.x_dropdown_2.addItems(self.data.columns)
-        self.x_dropdown_2.setFixedSize(200, 30)
-
-        self.y_dropdown_2 = QComboBox(self)
-        self.y_dropdown_2.addItems(self.data.columns)
-        self.y_dropdown_2.setFixedSize(200, 30)
-
-        self.color_dropdown_2 = QComboBox(self)
-        self.color_dropdown_2.addItems(self.data.columns)
-        self.color_dropdown_2.setFixedSize(200, 30)
-
-        self.size_dropdown_2 = QComboBox(self)
-        self.size_dropdown_2.addItems(self.data.columns)
-        self.size_dropdown_2.setFixedSize(200, 30)
-
-        self.size_slider_2 = QSlider(Qt.Orientation.Horizontal, self)
-        self.size_slider_2.setRange(1, 100)
-        self.size_slider_2.setValue(50)
-        self.size_slider_2.valueChanged.connect(self.update_data)
-
-        self.toggle_legend_btn_2 = QPushButton("Legend (Graph 2)", self)
-        self.toggle_legend_btn_2.setIcon(QIcon("Icons/ToggleButtonOn.png"))
-        self.toggle_legend_btn_2.setIconSize(QSize(40, 40))
-        self.toggle_legend_btn_2.setFixedSize(150, 25)
-        self.toggle_legend_btn_2.setStyleSheet("""
-            QPushButton {
-                border: none;
-            }
-        """)
-        self.toggle_legend_btn_2.clicked.connect(lambda: self.toggle_legend(2))
-
-        controls_container_2 = QVBoxLayout()
-        controls_layout_2 = QGridLayout()
-
-        controls_layout_2.addWidget(self.toggle_legend_btn_2, 0, 0, 1, 4)
-        controls_layout_2.addWidget(QLabel('X Axis (Graph 2):'), 1, 0)
-        controls_layout_2.addWidget(self.x_dropdown_2, 1, 1)
-        controls_layout_2.addWidget(QLabel('Y Axis (Graph 2):'), 1, 2)
-        controls_layout_2.addWidget(self.y_dropdown_2, 1, 3)
-        controls_layout_2.addWidget(QLabel('Size (Graph 2):'), 2, 0)
-        controls_layout_2.addWidget(self.size_dropdown_2, 2, 1)
-        controls_layout_2.addWidget(QLabel('Color (Graph 2):'), 2, 2)
-        controls_layout_2.addWidget(self.color_dropdown_2, 2, 3)
-        controls_layout_2.addWidget(QLabel('Size Scale (Graph 2):'), 3, 0)
-        controls_layout_2.addWidget(self.size_slider_2, 3, 1, 1, 3)
-
-        controls_container_2.addLayout(controls_layout_2)
+        # One list model shared by every column dropdown
+        self.column_model = QStringListModel(list(self.data.columns), self)
 
-        graph2_layout.addWidget(NavigationToolbar(self.mpl_canvas_2, self))
-        graph2_layout.addWidget(self.mpl_canvas_2)
-        graph2_layout.addLayout(controls_container_2)
+        graph1_layout = self.build_graph_layout(1)
+        graph2_layout = self.build_graph_layout(2)
 
         # TOOLTIP
         self.toggle_tooltip_btn = QPushButton("Tooltip", self)
@@ -649,18 +713,23 @@ class BrushingChart(QWidget):
         main_layout.addWidget(tooltip_widget, 1, 0, 1, 2)      # BOTTOM: Tooltip button
         main_layout.setRowStretch(0, 1)
 
-        for dropdown in [self.x_dropdown_1, self.y_dropdown_1, self.size_dropdown_1, self.color_dropdown_1]:
-            dropdown.activated.connect(self.update_data)
-
-        for dropdown in [self.x_dropdown_2, self.y_dropdown_2, self.size_dropdown_2, self.color_dropdown_2]:
-            dropdown.activated.connect(self.update_data)
-
         self.color_bar_1 = None
         self.color_bar_2 = None
+        self._size_cache = {}
+        self._num = {}
+        self.build_tooltip_text()
 
         self.brush1 = Brush(self.data, self.ax_1, self.mpl_canvas_1, [], [])
         self.brush2 = Brush(self.data, self.ax_2, self.mpl_canvas_2, [], [])
 
+        self.background_1 = None
+        self.background_2 = None
+        self.hover_marker_1 = None
+        self.hover_marker_2 = None
+        # Connected before the selectors so the cached backgrounds never contain their rectangles
+        self.mpl_canvas_1.mpl_connect('draw_event', lambda event: self.on_draw(1))
+        self.mpl_canvas_2.mpl_connect('draw_event', lambda event: self.on_draw(2))
+
         self.selector1 = RectangleSelector(self.ax_1, lambda eclick, erelease: self.select(eclick, erelease, 1),
                                            interactive=True, button=[1], minspanx=5, minspany=5, spancoords='pixels', useblit=True)
         self.selector2 = RectangleSelector(self.ax_2, lambda eclick, erelease: self.select(eclick, erelease, 2),
@@ -677,17 +746,96 @@ class BrushingChart(QWidget):
         self.tooltip.setGraphicsEffect(shadow)
         self.tooltip.hide()
 
-        self.mpl_canvas_1.mpl_connect('motion_notify_event', self.on_hover)
-        self.mpl_canvas_2.mpl_connect('motion_notify_event', self.on_hover)
+        self.setup_hover()
+
+        self.mpl_canvas_1.mpl_connect('motion_notify_event', self.queue_hover)
+        self.mpl_canvas_2.mpl_connect('motion_notify_event', self.queue_hover)
 
         self.update_data()
 
-    def update_data(self):
-        self.update_graph(self.ax_1, self.mpl_canvas_1, self.x_dropdown_1, self.y_dropdown_1,
-                          self.size_dropdown_1, self.color_dropdown_1, self.size_slider_1, 1)
+    def build_graph_layout(self, graph_number):
+        graph_layout = QVBoxLayout()
+        canvas = FigureCanvas(Figure(figsize=(9, 7)))
+        setattr(self, f'mpl_canvas_{graph_number}', canvas)
+        setattr(self, f'ax_{graph_number}', canvas.figure.subplots())
+
+        dropdowns = {}
+        for name in ('x', 'y', 'color', 'size'):
+            dropdown = QComboBox(self)
+            dropdown.setModel(self.column_model)
+            dropdown.setFixedSize(200, 30)
+            dropdown.activated.connect(lambda _: self.update_one(graph_number))
+            setattr(self, f'{name}_dropdown_{graph_number}', dropdown)
+            dropdowns[name] = dropdown
+
+        size_slider = QSlider(Qt.Orientation.Horizontal, self)
+        size_slider.setRange(1, 100)
+        size_slider.setValue(50)
+        size_slider.valueChanged.connect(lambda _: self.on_slider_change(graph_number))
+        setattr(self, f'size_slider_{graph_number}', size_slider)
+
+        # Coalesce slider drags into a single rebuild of this graph once the value settles
+        slider_timer = QTimer(self)
+        slider_timer.setSingleShot(True)
+        slider_timer.setInterval(50)
+        slider_timer.timeout.connect(lambda: self.update_one(graph_number))
+        setattr(self, f'slider_timer_{graph_number}', slider_timer)
+
+        toggle_legend_btn = QPushButton(f"Legend (Graph {graph_number})", self)
+        toggle_legend_btn.setIcon(QIcon("Icons/ToggleButtonOn.png"))
+        toggle_legend_btn.setIconSize(QSize(40, 40))
+        toggle_legend_btn.setFixedSize(150, 25)
+        toggle_legend_btn.setStyleSheet("""
+            QPushButton {
+                border: none;
+            }
+        """)
+        toggle_legend_btn.clicked.connect(lambda: self.toggle_legend(graph_number))
+        setattr(self, f'toggle_legend_btn_{graph_number}', toggle_legend_btn)
+
+        controls_container = QVBoxLayout()
+        controls_layout = QGridLayout()
+
+        controls_layout.addWidget(toggle_legend_btn, 0, 0, 1, 4)
+        controls_layout.addWidget(QLabel(f'X Axis (Graph {graph_number}):'), 1, 0)
+        controls_layout.addWidget(dropdowns['x'], 1, 1)
+        controls_layout.addWidget(QLabel(f'Y Axis (Graph {graph_number}):'), 1, 2)
+        controls_layout.addWidget(dropdowns['y'], 1, 3)
+        controls_layout.addWidget(QLabel(f'Size (Graph {graph_number}):'), 2, 0)
+        controls_layout.addWidget(dropdowns['size'], 2, 1)
+        controls_layout.addWidget(QLabel(f'Color (Graph {graph_number}):'), 2, 2)
+        controls_layout.addWidget(dropdowns['color'], 2, 3)
+        controls_layout.addWidget(QLabel(f'Size Scale (Graph {graph_number}):'), 3, 0)
+        controls_layout.addWidget(size_slider, 3, 1, 1, 3)
+
+        controls_container.addLayout(controls_layout)
+
+        graph_layout.addWidget(NavigationToolbar(canvas, self))
+        graph_layout.addWidget(canvas)
+        graph_layout.addLayout(controls_container)
+        return graph_layout
 
-        self.update_graph(self.ax_2, self.mpl_canvas_2, self.x_dropdown_2, self.y_dropdown_2,
-                          self.size_dropdown_2, self.color_dropdown_2, self.size_slider_2, 2)
+    def update_data(self):
+        self.update_one(1)
+        self.update_one(2)
+
+    def update_one(self, graph_number):
+        self.update_graph(
+            getattr(self, f'ax_{graph_number}'),
+            getattr(self, f'mpl_canvas_{graph_number}'),
+            getattr(self, f'x_dropdown_{graph_number}'),
+            getattr(self, f'y_dropdown_{graph_number}'),
+            getattr(self, f'size_dropdown_{graph_number}'),
+            getattr(self, f'color_dropdown_{graph_number}'),
+            getattr(self, f'size_slider_{graph_number}'),
+            graph_number
+        )
+        # Rebuilding a graph drops its brush selection, so the linked graph goes back to full colour
+        other_number = 2 if graph_number == 1 else 1
+        other = getattr(self, f'brush{other_number}')
+        if len(other.selected):
+            getattr(self, f'selector{other_number}').clear()
+        other.reset_colors()
 
     def update_graph(self, ax, canvas, x_dropdown, y_dropdown, size_dropdown, color_dropdown, size_slider, graph_number):
         x_attr = x_dropdown.currentText()
@@ -698,37 +846,46 @@ class BrushingChart(QWidget):
 
         if not pd.api.types.is_numeric_dtype(self.data[color_attr]):
             self.data[color_attr] = pd.factorize(self.data[color_attr])[0]
-
-        size_data = pd.to_numeric(self.data[size_attr], errors='coerce').fillna(1)
-        size_data = size_data.clip(lower=0)
+            self._size_cache.pop(color_attr, None)
+            self._num.pop(color_attr, None)
+            self.brush1.drop_column(color_attr)
+            self.brush2.drop_column(color_attr)
+            self.build_tooltip_text()
+            self.size_legend_key_1 = None
+            self.size_legend_key_2 = None
 
         size_scaled = self.scale(size_attr, scale_factor)
 
-        color = pd.to_numeric(self.data[color_attr], errors='coerce')
-        norm = plt.Normalize(vmin=color.min(), vmax=color.max())
+        color = self.numeric_column(color_attr)
+        norm = plt.Normalize(vmin=np.nanmin(color), vmax=np.nanmax(color))
         cmap = plt.get_cmap('viridis')
         default_colors = cmap(norm(color))
 
-        if graph_number == 1:
-            self.brush1 = Brush(self.data, ax, canvas, default_colors, size_scaled)
-        elif graph_number == 2:
-            self.brush2 = Brush(self.data, ax, canvas, default_colors, size_scaled)
+        brush = getattr(self, f'brush{graph_number}')
+        brush.set_defaults(default_colors, size_scaled)
 
         ax.clear()
         scatter = ax.scatter(
             x=self.data[x_attr],
             y=self.data[y_attr],
             s=size_scaled,
-            c=self.data[color_attr],
+            c=color,
             cmap='viridis',
             alpha=0.6,
             edgecolors='w',
             linewidths=0.5
         )
-        if graph_number == 1:
-            self.brush1.scatter_plot = scatter
-        elif graph_number == 2:
-            self.brush2.scatter_plot = scatter
+        brush.scatter_plot = scatter
+
+        hover_marker = ax.scatter(
+            [], [],
+            facecolors='none',
+            edgecolors='black',
+            linewidths=2,
+            alpha=0.6,
+            animated=True
+        )
+        setattr(self, f'hover_marker_{graph_number}', hover_marker)
 
         color_bar = getattr(self, f'color_bar_{graph_number}')
         if color_bar is None:
@@ -740,8 +897,7 @@ class BrushingChart(QWidget):
 
         legend_enabled = getattr(self, f'legend_enabled_{graph_number}')
         if legend_enabled:
-            size_legend = add_dynamic_size_legend(ax, size_data, size_attr, scale_factor)
-            ax.add_artist(size_legend)
+            self.refresh_size_legend(graph_number, size_attr, scale_factor)
 
         ax.set_xlabel(x_attr, weight='bold')
         ax.set_ylabel(y_attr, weight='bold')
@@ -749,12 +905,71 @@ class BrushingChart(QWidget):
         title_text = f'{x_attr}, {y_attr}, {size_attr}, {color_attr}'
         ax.set_title(wrap_title(title_text, max_len=40), weight='bold', fontsize=10)
 
-        canvas.draw()
+        canvas.draw_idle()
     
+    def build_tooltip_text(self):
+        # One string per row so hovering never goes through pandas indexing
+        self.tooltip_text = [
+            f"Row Index: {row_index}\n" + "".join(f"{column}: {value}\n" for column, value in record.items())
+            for row_index, record in enumerate(self.data.to_dict('records'))
+        ]
+
+    def numeric_column(self, column):
+        if column not in self._num:
+            self._num[column] = pd.to_numeric(self.data[column], errors='coerce').to_numpy(dtype=np.float64)
+        return self._num[column]
+
+    def size_legend_data(self, size_attr):
+        return np.nan_to_num(self.numeric_column(size_attr), nan=1).clip(min=0)
+
+    def refresh_size_legend(self, graph_number, size_attr, scale_factor):
+        ax = getattr(self, f'ax_{graph_number}')
+        legend = getattr(self, f'size_legend_{graph_number}')
+        # The legend only depends on the size column and slider value, so skip unchanged rebuilds
+        key = (size_attr, scale_factor)
+        stale = key != getattr(self, f'size_legend_key_{graph_number}')
+        setattr(self, f'size_legend_key_{graph_number}', key)
+
+        if legend is None:
+            legend = add_dynamic_size_legend(ax, self.size_legend_data(size_attr), size_attr, scale_factor)
+            setattr(self, f'size_legend_{graph_number}', legend)
+        elif stale:
+            size_data = self.size_legend_data(size_attr)
+            # Reuse the legend artist and only update its marker sizes and labels
+            size_values, size_markers = dynamic_size_legend_values(size_data, scale_factor)
+            for handle, text, val, marker in zip(legend.legend_handles, legend.texts, size_values, size_markers):
+                handle.set_markersize(np.sqrt(marker))
+                text.set_text(f"{val:.1f}")
+            legend.set_title(f"{size_attr}")
+
+        # ax.clear() detaches the legend, so put it back on the axes when needed
+        if legend not in ax.get_children():
+            ax.add_artist(legend)
+        legend.set_visible(True)
+
+    def on_slider_change(self, graph_number):
+        self._fast_size_update(graph_number)
+        getattr(self, f'slider_timer_{graph_number}').start()
+
+    def _fast_size_update(self, graph_number):
+        # Live feedback while dragging: resize the bubbles only, legends and colorbars wait for the timer
+        size_dropdown = getattr(self, f'size_dropdown_{graph_number}')
+        size_slider = getattr(self, f'size_slider_{graph_number}')
+        brush = getattr(self, f'brush{graph_number}')
+        canvas = getattr(self, f'mpl_canvas_{graph_number}')
+
+        brush.sizes = self.scale(size_dropdown.currentText(), size_slider.value())
+        brush.scatter_plot.set_sizes(brush.sizes)
+        canvas.draw_idle()
+
     def scale(self, size_attr, scale):
-        size = pd.to_numeric(self.data[size_attr], errors='coerce')
         min_r, max_r = 50, 1000
-        return min_r + ((size - size.min()) / (size.max() - size.min())) * (max_r - min_r) * scale / 50
+        # The normalised column only depends on the data, so the slider path is a single multiply-add
+        if size_attr not in self._size_cache:
+            size = self.numeric_column(size_attr)
+            size_min, size_max = np.nanmin(size), np.nanmax(size)
+            self._size_cache[size_attr] = ((size - size_min) / (size_max - size_min)).astype(np.float32)
+        return min_r + self._size_cache[size_attr] * ((max_r - min_r) * scale / 50)
     
     def select(self, eclick, erelease, graph):
         x_attr1, y_attr1 = self.x_dropdown_1.currentText(), self.y_dropdown_1.currentText()
@@ -763,31 +978,56 @@ class BrushingChart(QWidget):
         if graph == 1:
             self.brush1.callback(eclick, erelease, x_attr1, y_attr1)
             
-            selected = self.brush1.selected.index if not self.brush1.selected.empty else []
-            self.brush2.update_colors(selected)
-            scale_2 = self.scale(self.size_dropdown_2.currentText(), self.size_slider_2.value())
-            
-            self.ax_2.scatter(self.data[x_attr2], self.data[y_attr2], s=scale_2, c=self.brush2.colors, alpha=0.6, edgecolors='w', linewidths=0.5)
-            self.mpl_canvas_2.draw()
-            
+            self.brush2.update_colors(self.brush1.selected)
+            self.brush2.draw_colors()
 
         if graph == 2:
             self.brush2.callback(eclick, erelease, x_attr2, y_attr2)
             
-            selected = self.brush2.selected.index if not self.brush2.selected.empty else []
-            self.brush1.update_colors(selected)
-            scale_1 = self.scale(self.size_dropdown_1.currentText(), self.size_slider_1.value())
-
-            self.ax_1.scatter(self.data[x_attr1], self.data[y_attr1], s=scale_1, c=self.brush1.colors, alpha=0.6, edgecolors='w', linewidths=0.5)
-            self.mpl_canvas_1.draw()
+            self.brush1.update_colors(self.brush2.selected)
+            self.brush1.draw_colors()
     
+    def on_draw(self, graph_number):
+        canvas = getattr(self, f'mpl_canvas_{graph_number}')
+        ax = getattr(self, f'ax_{graph_number}')
+        setattr(self, f'background_{graph_number}', canvas.copy_from_bbox(ax.bbox))
+        hover_marker = getattr(self, f'hover_marker_{graph_number}')
+        if hover_marker is not None:
+            ax.draw_artist(hover_marker)
+
+    def blit_hover(self, graph_number):
+        canvas = getattr(self, f'mpl_canvas_{graph_number}')
+        ax = getattr(self, f'ax_{graph_number}')
+        background = getattr(self, f'background_{graph_number}')
+        selector = getattr(self, f'selector{graph_number}')
+
+        if background is None:
+            canvas.draw_idle()
+            return
+
+        canvas.restore_region(background)
+        for artist in selector.artists:
+            if artist.get_visible():
+                ax.draw_artist(artist)
+        ax.draw_artist(getattr(self, f'hover_marker_{graph_number}'))
+        canvas.blit(ax.bbox)
+
+    def hide_hover_markers(self):
+        for graph_number in (1, 2):
+            hover_marker = getattr(self, f'hover_marker_{graph_number}')
+            if hover_marker is not None and hover_marker.get_visible():
+                hover_marker.set_visible(False)
+                self.blit_hover(graph_number)
+
     def on_hover(self, event):
         if not self.tooltip_enabled:
             self.tooltip.hide()
+            self.hide_hover_markers()
             return
         
         if event.inaxes not in [self.ax_1, self.ax_2]:
             self.tooltip.hide()
+            self.hide_hover_markers()
             return
         
         scatter = None
@@ -795,22 +1035,23 @@ class BrushingChart(QWidget):
         if event.inaxes == self.ax_1:
             scatter = self.brush1.scatter_plot
             canvas = self.mpl_canvas_1
+            graph_number = 1
         elif event.inaxes == self.ax_2:
             scatter = self.brush2.scatter_plot
             canvas = self.mpl_canvas_2
+            graph_number = 2
 
         if scatter is None:
             self.tooltip.hide()
             return
 
+        hover_marker = getattr(self, f'hover_marker_{graph_number}')
+
         cont, ind = scatter.contains(event)
         if cont:
             hovered_index = ind["ind"][0]
 
-            details = f"Row Index: {hovered_index}\n"
-            for column in self.data.columns:
-                value = self.data.iloc[hovered_index][column]
-                details += f"{column}: {value}\n"
+            details = self.tooltip_text[hovered_index]
             self.tooltip.setStyleSheet("""
                 background-color: white;
                 border-radius: 15px;
@@ -822,54 +1063,17 @@ class BrushingChart(QWidget):
             self.tooltip.adjustSize()
             self.tooltip.show()
 
-            global_pos = canvas.mapToGlobal(event.guiEvent.pos())
-            local_pos = self.mapFromGlobal(global_pos)
-
-            mouse_x = local_pos.x()
-            mouse_y = local_pos.y()
-            tooltip_width = self.tooltip.width()
-            tooltip_height = self.tooltip.height()
-
-            offset_x = 20
-            offset_y = 20
-
-            window_geometry = self.geometry()
-            window_width, window_height = (
-                window_geometry.width(),
-                window_geometry.height(),
-            )
-
-            if mouse_x + offset_x + tooltip_width > window_width:
-                offset_x = -tooltip_width - 20
-            if mouse_y + offset_y + tooltip_height > window_height:
-                offset_y = -tooltip_height - 20
-
-            if mouse_x + offset_x < 0:
-                offset_x = 20
-            if mouse_y + offset_y < 0:
-                offset_y = 20
-
-            new_x = mouse_x + offset_x
-            new_y = mouse_y + offset_y
+            place_tooltip(self.tooltip, self.local_pos(canvas, event), *self.window_size)
 
-            self.tooltip.move(new_x + 5, new_y + 5)
-
-            edge_colors = ["black" if i == hovered_index else "white" for i in range(len(self.data))]
-            scatter.set_edgecolors(edge_colors)
-            scatter.set_linewidths([2 if i == hovered_index else 0.5 for i in range(len(self.data))])
-
-            if event.inaxes == self.ax_1:
-                self.mpl_canvas_1.draw()
-            elif event.inaxes == self.ax_2:
-                self.mpl_canvas_2.draw()
+            hover_marker.set_offsets(scatter.get_offsets()[hovered_index:hovered_index + 1])
+            hover_marker.set_sizes(scatter.get_sizes()[hovered_index:hovered_index + 1])
+            hover_marker.set_visible(True)
+            self.blit_hover(graph_number)
         else:
             self.tooltip.hide()
-            scatter.set_edgecolors("white")
-            scatter.set_linewidths(0.5)
-            if event.inaxes == self.ax_1:
-                self.mpl_canvas_1.draw()
-            elif event.inaxes == self.ax_2:
-                self.mpl_canvas_2.draw()
+            if hover_marker.get_visible():
+                hover_marker.set_visible(False)
+                self.blit_hover(graph_number)
 
     def toggle_tooltip(self):
         self.tooltip_enabled = not self.tooltip_enabled
@@ -886,85 +1090,85 @@ class BrushingChart(QWidget):
             if self.legend_enabled_1:
                 size_attr = self.size_dropdown_1.currentText()
                 scale_factor = self.size_slider_1.value()
-                size_data = pd.to_numeric(self.data[size_attr], errors='coerce').fillna(1).clip(lower=0)
-                size_legend = add_dynamic_size_legend(self.ax_1, size_data, size_attr, scale_factor)
-                self.ax_1.add_artist(size_legend)
+                self.refresh_size_legend(1, size_attr, scale_factor)
                 self.toggle_legend_btn_1.setIcon(QIcon("Icons/ToggleButtonOn.png"))
             else:
-                legend = self.ax_1.get_legend()
+                legend = self.size_legend_1
                 if legend is not None:
                     legend.set_visible(False)
                     self.toggle_legend_btn_1.setIcon(QIcon("Icons/ToggleButtonOff.png"))
-            self.mpl_canvas_1.draw()
+            self.mpl_canvas_1.draw_idle()
         elif graph_number == 2:
             self.legend_enabled_2 = not self.legend_enabled_2
             if self.legend_enabled_2:
                 size_attr = self.size_dropdown_2.currentText()
                 scale_factor = self.size_slider_2.value()
-                size_data = pd.to_numeric(self.data[size_attr], errors='coerce').fillna(1).clip(lower=0)
-                size_legend = add_dynamic_size_legend(self.ax_2, size_data, size_attr, scale_factor)
-                self.ax_2.add_artist(size_legend)
+                self.refresh_size_legend(2, size_attr, scale_factor)
                 self.toggle_legend_btn_2.setIcon(QIcon("Icons/ToggleButtonOn.png"))
             else:
-                legend = self.ax_2.get_legend()
+                legend = self.size_legend_2
                 if legend is not None:
                     legend.set_visible(False)
                     self.toggle_legend_btn_2.setIcon(QIcon("Icons/ToggleButtonOff.png"))
-            self.mpl_canvas_2.draw()
+            self.mpl_canvas_2.draw_idle()
 
 ''' -------- Map Chart App -------- '''
-class MapChart(QWidget):
+class MapChart(HoverMixin, QWidget):
     def __init__(self):
         super().__init__()
 
         self.is_zooming = False
         self.highlight_patch = None
+        self.highlight_index = None
+        self.background = None
         self.visible_labels = []
 
-        self.worldmap = gpd.read_file("world_map.json", driver='GeoJSON')
+        self.worldmap = _load_worldmap().copy()
 
-        self.data = pd.read_csv("WHR2023.csv")    
-        country_to_code = {country.name: country.alpha_3 for country in pycountry.countries}
-        
-        self.data['Country code'] = self.data['Country name'].map(country_to_code)
-
-        manual_mapping = {
-            "Taiwan Province of China": "TWN",
-            "Kosovo": "XKX",
-            "South Korea": "KOR",
-            "Moldova": "MDA",
-            "Vietnam": "VNM",
-            "Bolivia": "BOL",
-            "Russia": "RUS",
-            "Hong Kong S.A.R. of China": "HKG",
-            "Congo (Brazzaville)": "COG",
-            "Congo (Kinshasa)": "COD",
-            "Venezuela": "VEN",
-            "Laos": "LAO",
-            "Ivory Coast": "CIV",
-            "State of Palestine": "PSE",
-            "Iran": "IRN",
-            "Turkiye": "TUR",
-            "Tanzania": "TZA",
-        }
-        self.data['Country code'] = self.data['Country code'].fillna(self.data['Country name'].map(manual_mapping))
+        # Label anchors and areas only depend on the outlines, so zooming reuses them
+        label_points = [label_point(geometry) for geometry in self.worldmap.geometry]
+        self.label_xy = np.array([(p.x, p.y) if p is not None else (np.nan, np.nan) for p in label_points])
+        self.areas = shapely.area(self.worldmap.geometry.to_numpy())
+        self.outline_coords = [exterior_coords(geometry) for geometry in self.worldmap.geometry]
+
+        self.data = _load_whr_with_codes().copy()
 
         # Map ladder score to worldmap using ISO codes
         country_happiness = dict(zip(self.data['Country code'], self.data['Ladder score']))
         self.worldmap['Ladder score'] = self.worldmap['adm0_a3'].map(country_happiness)
 
+        # Tooltip text per ISO code, built once; the first row wins if a code repeats
+        self.country_details = {}
+        for _, data_row in self.data.dropna(subset=['Country code']).iterrows():
+            self.country_details.setdefault(data_row['Country code'], format_tooltip_html(data_row))
+
         color = pd.to_numeric(self.data["Ladder score"], errors='coerce')
         norm = plt.Normalize(vmin=color.min(), vmax=color.max())
         colormap = plt.get_cmap('viridis')
 
-        self.worldmap['color'] = self.worldmap['Ladder score'].apply(
-            lambda x: colormap(norm(x)) if pd.notna(x) else (0.8, 0.8, 0.8, 1)
-        )
+        # One colormap lookup for every scored country; countries without data stay light gray
+        scores = self.worldmap['Ladder score'].to_numpy(dtype=np.float64)
+        has_score = ~np.isnan(scores)
+        colors = np.tile((0.8, 0.8, 0.8, 1.0), (len(scores), 1))
+        colors[has_score] = colormap(norm(scores[has_score]))
+        self.worldmap['color'] = [tuple(rgba) for rgba in colors]
+
+        # Drawing, labels and highlights keep the original outlines. Hover tests a lighter copy:
+        # each country is simplified on its own, so shared borders drift by up to the tolerance,
+        # and 0.005 degrees keeps those gaps and overlaps under a pixel until well past country-level zoom
+        simplified = self.worldmap.geometry.simplify(tolerance=0.005, preserve_topology=True)
+        self.country_geoms = shapely.set_precision(simplified.to_numpy(), 1e-5)
+
+        # Spatial index over the hit-test outlines so hovering only tests nearby polygons
+        self.country_tree = shapely.STRtree(self.country_geoms)
+        # Prepared geometries carry their own edge index, which contains_xy uses on every hover
+        shapely.prepare(self.country_geoms)
 
         self.figure, self.ax = plt.subplots(figsize=(15, 8))
         self.canvas = FigureCanvas(self.figure)
 
         self.plot_map()
+        self.build_highlight_patches()
 
         self.tooltip = QLabel(self)
         self.tooltip.setStyleSheet("background-color: white; border-radius: 15px; padding: 5px;")
@@ -976,8 +1180,12 @@ class MapChart(QWidget):
         self.tooltip.setGraphicsEffect(shadow)
         self.tooltip.hide()
 
-        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
+        self.setup_hover()
+
+        self.hover_cid = self.canvas.mpl_connect("motion_notify_event", self.queue_hover)
+        self.canvas.mpl_connect('button_press_event', self.on_press)
         self.canvas.mpl_connect('button_release_event', self.on_zoom)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         layout = QVBoxLayout()
         layout.addWidget(NavigationToolbar(self.canvas, self))
@@ -990,6 +1198,7 @@ class MapChart(QWidget):
             color=self.worldmap["color"],
             edgecolor='black',
             linewidth=1,
+            rasterized=True,
         )
 
         norm = plt.Normalize(vmin=self.worldmap['Ladder score'].min(), vmax=self.worldmap['Ladder score'].max())
@@ -1003,31 +1212,41 @@ class MapChart(QWidget):
         self.ax.axis('off')
         self.ax.set_frame_on(False)
         self.ax.margins(0)
+        # Fit the limits once; labels and highlight outlines must not trigger another autoscale
+        self.ax.autoscale_view()
+        self.ax.set_autoscale_on(False)
         self.figure.tight_layout()
 
         self.plot_labels()
 
     def plot_labels(self):
-        for idx, row in self.worldmap.iterrows():
-            if pd.notna(row["Ladder score"]) and row['geometry'] is not None:
-                if row['geometry'].geom_type == "Polygon":
-                    point = row['geometry'].representative_point()
-                elif row['geometry'].geom_type == "MultiPolygon":
-                    largest_polygon = max(row['geometry'].geoms, key=lambda p: p.area)
-                    point = largest_polygon.representative_point()
-                else:
-                    continue
-
-                label_text = f"{row['Ladder score']:.1f}"
-                text = self.ax.text(
-                    point.x, point.y, label_text,
-                    fontsize=8, ha='center', va='center', color='black', weight='bold',
-                    bbox=dict(facecolor='white', edgecolor='none', alpha=0, visible=False)
-                )
-                self.visible_labels.append((text, row['geometry']))
+        scores = self.worldmap['Ladder score'].to_numpy(dtype=np.float64)
+        # Scored countries with a polygon to anchor on; other geometry types have NaN anchors
+        labelled = ~np.isnan(scores) & ~np.isnan(self.label_xy[:, 0])
+
+        for idx in np.flatnonzero(labelled):
+            label_x, label_y = self.label_xy[idx]
+            text = self.ax.text(
+                label_x, label_y, f"{scores[idx]:.1f}",
+                fontsize=8, ha='center', va='center', color='black', weight='bold',
+                bbox=dict(facecolor='white', edgecolor='none', alpha=0, visible=False)
+            )
+            self.visible_labels.append((text, idx))
         self.update_labels()
     
+    def on_press(self, event):
+        # No hover work while a zoom box or pan drag is in progress
+        if self.ax.get_navigate_mode() in ('ZOOM', 'PAN') and self.hover_cid is not None:
+            self.is_zooming = self.ax.get_navigate_mode() == 'ZOOM'
+            self.canvas.mpl_disconnect(self.hover_cid)
+            self.hover_cid = None
+            self.pending_hover_event = None
+            self.clear_hover()
+
     def on_zoom(self, event):
+        if self.hover_cid is None:
+            self.hover_cid = self.canvas.mpl_connect("motion_notify_event", self.queue_hover)
+
         if self.ax.get_navigate_mode() == 'ZOOM':
             self.is_zooming = False
             self.update_labels()
@@ -1035,57 +1254,36 @@ class MapChart(QWidget):
             
     def update_labels(self):
         xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
-        visible_area = shapely.geometry.box(xlim[0], ylim[0], xlim[1], ylim[1])
-
-        for text, geometry in self.visible_labels:
-            if geometry.geom_type == "Polygon":
-                representative_point = geometry.representative_point()
-            elif geometry.geom_type == "MultiPolygon":
-                largest_polygon = max(geometry.geoms, key=lambda p: p.area)
-                representative_point = largest_polygon.representative_point()
-            else:
-                text.set_visible(False)
-                continue
+        x, y = self.label_xy[:, 0], self.label_xy[:, 1]
+        visible_area = (xlim[1] - xlim[0]) * (ylim[1] - ylim[0])
 
-            point_in_visible_area = visible_area.contains(representative_point)
-            country_area = geometry.area
-            label_visible = point_in_visible_area and country_area > visible_area.area * 0.0015
-            text.set_visible(label_visible)
+        # Anchor strictly inside the view (as box.contains was) and country large enough at this zoom
+        label_visible = (
+            (x > xlim[0]) & (x < xlim[1]) & (y > ylim[0]) & (y < ylim[1])
+            & (self.areas > visible_area * 0.0015)
+        )
+        for text, idx in self.visible_labels:
+            text.set_visible(bool(label_visible[idx]))
 
     def on_hover(self, event):
-        if self.ax.get_navigate_mode() == "ZOOM":
-            self.is_zooming = True
-
         if event.inaxes != self.ax:
-            self.tooltip.hide()
-            self.remove_highlight()
+            self.clear_hover()
             return
         
         hover_point = shapely.geometry.Point(event.xdata, event.ydata)
 
-        for idx, row in self.worldmap.iterrows():
-            if row['geometry'].contains(hover_point):
+        # Bounding-box candidates in row order, so overlapping outlines resolve as before
+        candidates = np.sort(self.country_tree.query(hover_point))
+        hits = candidates[shapely.contains_xy(self.country_geoms[candidates], event.xdata, event.ydata)]
+        if len(hits):
+            idx = hits[0]
+            row = self.worldmap.iloc[idx]
+            # Still over the same country: the text and outline are already up, only follow the cursor
+            if idx != self.highlight_index:
                 country_name = row.get("name", "Unknown Country")
                 ladder_score = row.get("Ladder score", "No Data")
-                data_row = self.data[self.data['Country code'] == row['adm0_a3']].iloc[0] if not self.data[self.data['Country code'] == row['adm0_a3']].empty else None
-                if data_row is not None:
-                    details = (
-                        f"<b>{data_row['Country name']}</b><br>"
-                        f"Ladder Score: {data_row['Ladder score']:.2f}<br>"
-                        f"Standard Error: {data_row['Standard error of ladder score']:.2f}<br>"
-                        f"Upperwhisker: {data_row['upperwhisker']:.2f}<br>"
-                        f"Lowerwhisker: {data_row['lowerwhisker']:.2f}<br>"
-                        f"Logged GDP per Capita: {data_row['Logged GDP per capita']:.2f}<br>"
-                        f"Social Support: {data_row['Social support']:.2f}<br>"
-                        f"Healthy Life Expectancy: {data_row['Healthy life expectancy']:.2f}<br>"
-                        f"Freedom to Make Life Choices: {data_row['Freedom to make life choices']:.2f}<br>"
-                        f"Generosity: {data_row['Generosity']:.2f}<br>"
-                        f"Perceptions of Corruption: {data_row['Perceptions of corruption']:.2f}<br>"
-                        f"Explained by Log GDP per Capita: {data_row['Explained by: Log GDP per capita']:.2f}<br>"
-                        f"Explained by Social Support: {data_row['Explained by: Social support']:.2f}<br>"
-                        f"Explained by Healthy Life Expectancy: {data_row['Explained by: Healthy life expectancy']:.2f}<br>"
-                        f"Explained by Freedom to Make Life Choices: {data_row['Explained by: Freedom to make life choices']:.2f}"
-                    )
+                details = self.country_details.get(row['adm0_a3'])
+                if details is not None:
                     self.tooltip.setFixedSize(375, 315)
                 else:
                     details = f"<b>{country_name}</b><br>Happiness Score: {ladder_score}"
@@ -1102,66 +1300,64 @@ class MapChart(QWidget):
                 self.tooltip.raise_()
                 self.tooltip.show()
 
-                global_pos = self.canvas.mapToGlobal(event.guiEvent.pos())
-                local_pos = self.mapFromGlobal(global_pos)
+                self.highlight_index = idx
+                self.highlight_country(idx)
+                self.blit_highlight()
 
-                mouse_x = local_pos.x()
-                mouse_y = local_pos.y()
-                tooltip_width = self.tooltip.width()
-                tooltip_height = self.tooltip.height()
-
-                offset_x = 20
-                offset_y = 20
-
-                window_geometry = self.geometry()
-                window_width, window_height = (
-                    window_geometry.width(),
-                    window_geometry.height(),
-                )
+            place_tooltip(self.tooltip, self.local_pos(self.canvas, event), *self.window_size)
+        else:
+            self.clear_hover()
 
-                if mouse_x + offset_x + tooltip_width > window_width:
-                    offset_x = -tooltip_width - 20
-                if mouse_y + offset_y + tooltip_height > window_height:
-                    offset_y = -tooltip_height - 20
+    def clear_hover(self):
+        self.tooltip.hide()
+        self.highlight_index = None
+        if self.highlight_patch:
+            self.remove_highlight()
+            self.blit_highlight()
 
-                if mouse_x + offset_x < 0:
-                    offset_x = 20
-                if mouse_y + offset_y < 0:
-                    offset_y = 20
+    def on_draw(self, event):
+        # Cache the rendered map without the highlight so hovering only needs a blit
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self.highlight_patch:
+            self.ax.draw_artist(self.highlight_patch)
 
-                new_x = mouse_x + offset_x
-                new_y = mouse_y + offset_y
+    def blit_highlight(self):
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
 
-                self.tooltip.move(new_x + 5, new_y + 5)
+        self.canvas.restore_region(self.background)
+        if self.highlight_patch:
+            self.ax.draw_artist(self.highlight_patch)
+        self.canvas.blit(self.figure.bbox)
+
+    def build_highlight_patches(self):
+        # One hidden red outline per country, so hovering only toggles visibility
+        self.highlight_patches = []
+        for outlines in self.outline_coords:
+            if not outlines:
+                self.highlight_patches.append(None)
+                continue
 
-                self.highlight_country(row['geometry'])
-                self.canvas.draw()
-                break
-        else:
-            self.tooltip.hide()
-            self.remove_highlight()
-            self.canvas.draw()
+            patches = [
+                Polygon(coords, linewidth=2, edgecolor="red", facecolor="none")
+                for coords in outlines
+            ]
+            highlight = PatchCollection(patches, match_original=True, animated=True, visible=False)
+            self.ax.add_collection(highlight, autolim=False)
+            self.highlight_patches.append(highlight)
 
-    def highlight_country(self, geometry):
+    def highlight_country(self, idx):
         if self.highlight_patch:
             self.remove_highlight()
 
-        patches = []
-
-        if geometry.geom_type == "Polygon":
-            patches.append(Polygon(geometry.exterior.coords, linewidth=2, edgecolor="red", facecolor="none"))
-        elif geometry.geom_type == "MultiPolygon":
-            for poly in geometry.geoms:
-                patches.append(Polygon(poly.exterior.coords, linewidth=2, edgecolor="red", facecolor="none"))
-        else:
-            return
-        
-        self.highlight_patch = PatchCollection(patches, match_original=True)
-        self.ax.add_collection(self.highlight_patch)
+        self.highlight_patch = self.highlight_patches[idx]
+        if self.highlight_patch:
+            self.highlight_patch.set_visible(True)
 
     def remove_highlight(self):
         if self.highlight_patch:
-            self.highlight_patch.remove()
+            self.highlight_patch.set_visible(False)
             self.highlight_patch = None
 
 class MainApp(QMainWindow):